@@ -146,13 +146,20 @@ class JobShopInstance:
     @classmethod
     def from_matrices(
         cls,
-        duration_matrix: list[list[int]],
-        machines_matrix: list[list[list[int]]] | list[list[int]],
+        duration_matrix: list[list[int]] | NDArray[np.integer],
+        machines_matrix: (
+            list[list[list[int]]] | list[list[int]] | NDArray[np.integer]
+        ),
         name: str = "JobShopInstance",
         metadata: dict[str, Any] | None = None,
     ) -> JobShopInstance:
         """Creates a JobShopInstance from duration and machines matrices.
 
+        Both matrices can also be given as integer numpy arrays (e.g., of
+        shape (``num_jobs``, ``num_operations_per_job``) for a regular,
+        non-flexible instance). They are converted to nested lists of Python
+        integers with a single call to :meth:`numpy.ndarray.tolist`.
+
         Args:
             duration_matrix:
                 A list of lists of integers. The i-th list contains the
@@ -169,18 +176,28 @@ class JobShopInstance:
 
         Returns:
             A JobShopInstance object.
+
+        Raises:
+            ValueError:
+                If the number of jobs or of operations of a job differs
+                between the two matrices.
         """
-        jobs: list[list[Operation]] = [[] for _ in range(len(duration_matrix))]
-
-        num_jobs = len(duration_matrix)
-        for job_id in range(num_jobs):
-            num_operations = len(duration_matrix[job_id])
-            for position_in_job in range(num_operations):
-                duration = duration_matrix[job_id][position_in_job]
-                machines = machines_matrix[job_id][position_in_job]
-                jobs[job_id].append(
-                    Operation(duration=duration, machines=machines)
+        if isinstance(duration_matrix, np.ndarray):
+            duration_matrix = duration_matrix.tolist()
+        if isinstance(machines_matrix, np.ndarray):
+            machines_matrix = machines_matrix.tolist()
+
+        jobs = [
+            [
+                Operation(machines=machines, duration=duration)
+                for duration, machines in zip(
+                    job_durations, job_machines, strict=True
                 )
+            ]
+            for job_durations, job_machines in zip(
+                duration_matrix, machines_matrix, strict=True
+            )
+        ]
 
         metadata = {} if metadata is None else metadata
         return cls(jobs=jobs, name=name, **metadata)
@@ -207,10 +224,15 @@ class JobShopInstance:
 
         Computed as the maximum machine id present in the instance plus one.
         """
-        max_machine_id = -1
-        for job in self.jobs:
-            for operation in job:
-                max_machine_id = max(max_machine_id, *operation.machines)
+        max_machine_id = max(
+            (
+                machine_id
+                for job in self.jobs
+                for operation in job
+                for machine_id in operation.machines
+            ),
+            default=-1,
+        )
         return max_machine_id + 1
 
     @functools.cached_property
@@ -25,6 +25,7 @@ def load_all_benchmark_instances() -> dict[str, JobShopInstance]:
     }
 
 
+@functools.cache
 def load_benchmark_instance(name: str) -> JobShopInstance:
     """Loads a specific benchmark instance.
 
@@ -33,6 +34,14 @@ def load_benchmark_instance(name: str) -> JobShopInstance:
     provided name. Since `load_benchmark_json` is cached, the file is only
     read once.
 
+    Results are cached, so loading the same instance again returns the same
+    :class:`JobShopInstance` object.
+
+    Warning:
+        Since the returned instance is shared between calls, it should not be
+        modified. Use :func:`copy.deepcopy` to get an independent copy if
+        you need to modify it.
+
     Args:
         name: The name of the benchmark instance to load. Can be one of the
             following: "abz5-9", "ft06", "ft10", "ft20", "la01-40", "orb01-10",
@@ -75,6 +84,11 @@ def load_benchmark_json() -> dict[str, dict[str, Any]]:
         :class:`~job_shop_lib.JobShopInstance`'s
         :meth:`~job_shop_lib.JobShopInstance.to_dict` method.
 
+    Tip:
+        If `orjson <https://github.com/ijl/orjson>`_ is installed, it is used
+        to parse the file instead of the standard library's ``json`` module,
+        which is about twice as fast.
+
     Returns:
         The dictionary containing the benchmark instances represented as
         dictionaries.
@@ -84,5 +98,10 @@ def load_benchmark_json() -> dict[str, dict[str, Any]]:
         / "benchmark_instances.json"
     )
 
-    with benchmark_file.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    data = benchmark_file.read_bytes()
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        return orjson.loads(data)
+    except ImportError:
+        return json.loads(data)
@@ -55,6 +55,12 @@ class DispatcherObserver(abc.ABC):
     """If True, ensures only one instance of this observer type is subscribed
     to the dispatcher."""
 
+    _reset_if_nothing_scheduled = True
+    """If False, :meth:`reset` is not called when the dispatcher is reset
+    before any operation has been scheduled since its previous reset. Only
+    observers whose state is fully determined by the dispatcher's state
+    (e.g., feature observers) should set it to False."""
+
     def __init__(
         self,
         dispatcher: Dispatcher,
@@ -238,14 +244,25 @@ class Dispatcher:
         self.subscribers.remove(observer)
 
     def reset(self) -> None:
-        """Resets the dispatcher to its initial state."""
+        """Resets the dispatcher to its initial state.
+
+        Subscribers are reset too, except those that set
+        ``_reset_if_nothing_scheduled`` to ``False`` (e.g., feature
+        observers) when no operation has been scheduled since the last reset.
+        Their state already matches the initial state of the dispatcher, so
+        resetting them (i.e., recomputing all their features) would be
+        wasted work.
+        """
+        anything_scheduled = self.schedule.num_scheduled_operations > 0
         self.schedule.reset()
         self._machine_next_available_time = [0] * self.instance.num_machines
         self._job_next_operation_index = [0] * self.instance.num_jobs
         self._job_next_available_time = [0] * self.instance.num_jobs
         self._cache = {}
         for subscriber in self.subscribers:
-            subscriber.reset()
+            # pylint: disable=protected-access
+            if anything_scheduled or subscriber._reset_if_nothing_scheduled:
+                subscriber.reset()
 
     def dispatch(self, operation: Operation, machine_id: int) -> None:
         """Schedules the given operation on the given machine.
@@ -57,8 +57,14 @@ class CompositeFeatureObserver(FeatureObserver):
         uses this feature observer to aggregate features from multiple
         ones.
 
+    Unlike other feature observers, it is always reset when the dispatcher is
+    reset. This ensures that the environments never return the same arrays in
+    two different observations.
+
     """
 
+    _reset_if_nothing_scheduled = True
+
     __slots__ = {
         "feature_observers": (
             "List of :class:`FeatureObserver` instances to aggregate features "
@@ -146,10 +152,21 @@ class CompositeFeatureObserver(FeatureObserver):
             for feature_type, feature_matrix in observer.features.items():
                 features[feature_type].append(feature_matrix)
 
-        self.features = {
-            feature_type: np.concatenate(features, axis=1)
-            for feature_type, features in features.items()
-        }
+        # A new buffer is allocated on each call because the arrays in
+        # `features` are returned as observations by the environments.
+        self._allocate_features(
+            {
+                feature_type: (
+                    feature_matrices[0].shape[0],
+                    sum(matrix.shape[1] for matrix in feature_matrices),
+                )
+                for feature_type, feature_matrices in features.items()
+            }
+        )
+        for feature_type, feature_matrices in features.items():
+            np.concatenate(
+                feature_matrices, axis=1, out=self.features[feature_type]
+            )
 
     def _set_column_names(self):
         for observer in self.feature_observers:
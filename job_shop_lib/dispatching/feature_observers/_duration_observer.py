@@ -64,7 +64,7 @@ class DurationObserver(FeatureObserver):
         operation_durations = operation_durations[
             ~np.isnan(operation_durations)
         ].reshape(-1, 1)
-        self.features[FeatureType.OPERATIONS] = operation_durations
+        self.features[FeatureType.OPERATIONS][:] = operation_durations
 
     def _initialize_machine_durations(self):
         machine_durations = self.dispatcher.instance.machine_loads
@@ -55,18 +55,30 @@ class EarliestStartTimeObserver(FeatureObserver):
             "method."
         ),
         "_job_ids": (
-            "An array that stores the job IDs for each operation in the "
-            "dispatcher's instance. The array has shape "
-            "(``num_machines``, ``max_operations_per_machine``)."
+            "A 1D array that stores the job id of each operation in "
+            ":attr:`~job_shop_lib.JobShopInstance.operations_by_machine`, "
+            "flattened machine by machine. Flexible operations appear once "
+            "per machine that can process them."
         ),
         "_positions": (
-            "An array that stores the positions of each operation in their "
-            "respective jobs. The array has shape "
-            "(``num_machines``, ``max_operations_per_machine``)."
+            "A 1D array that stores the position in job of each operation "
+            "in the same order as ``_job_ids``."
         ),
-        "_is_regular_instance": (
-            "Whether the dispatcher's instance is a regular "
-            "instance, where each job has the same number of operations."
+        "_machine_ids": (
+            "A 1D array that stores the machine id of each entry in "
+            "``_job_ids`` and ``_positions``."
+        ),
+        "_machine_offsets": (
+            "A 1D array of length ``num_machines + 1``. The entries of the "
+            "machine with id i are stored between the indices "
+            "``_machine_offsets[i]`` and ``_machine_offsets[i + 1]``."
+        ),
+        "_job_lengths": "A 1D array with the number of operations per job.",
+        "_operations_mask": (
+            "A boolean mask over the raveled ``earliest_start_times`` array "
+            "that selects the entries corresponding to existing operations. "
+            "Since operations are numbered job by job, the selected entries "
+            "are ordered by operation id."
         ),
     }
 
@@ -88,30 +100,36 @@ class EarliestStartTimeObserver(FeatureObserver):
             )
         )
         self.earliest_start_times[np.isnan(squared_duration_matrix)] = np.nan
+        self._operations_mask = ~np.isnan(squared_duration_matrix).ravel()
         # -------------------------------
 
         # Cache:
-        operations_by_machine = dispatcher.instance.operations_by_machine
-        self._is_regular_instance = all(
-            len(job) == len(dispatcher.instance.jobs[0])
-            for job in dispatcher.instance.jobs
+        instance = dispatcher.instance
+        operations_by_machine = instance.operations_by_machine
+        self._job_ids = np.array(
+            [
+                op.job_id
+                for machine_ops in operations_by_machine
+                for op in machine_ops
+            ],
+            dtype=int,
         )
-        if self._is_regular_instance:
-            self._job_ids = np.array(
-                [
-                    [op.job_id for op in machine_ops]
-                    for machine_ops in operations_by_machine
-                ]
-            )
-            self._positions = np.array(
-                [
-                    [op.position_in_job for op in machine_ops]
-                    for machine_ops in operations_by_machine
-                ]
-            )
-        else:
-            self._job_ids = np.array([])
-            self._positions = np.array([])
+        self._positions = np.array(
+            [
+                op.position_in_job
+                for machine_ops in operations_by_machine
+                for op in machine_ops
+            ],
+            dtype=int,
+        )
+        machine_ops_count = [len(ops) for ops in operations_by_machine]
+        self._machine_ids = np.repeat(
+            np.arange(instance.num_machines), machine_ops_count
+        )
+        self._machine_offsets: NDArray[np.int_] = np.concatenate(
+            (np.zeros(1, dtype=int), np.cumsum(machine_ops_count))
+        )
+        self._job_lengths = np.array([len(job) for job in instance.jobs])
 
         super().__init__(
             dispatcher, feature_types=feature_types, subscribe=subscribe
@@ -152,136 +170,106 @@ class EarliestStartTimeObserver(FeatureObserver):
 
         # Now, we compute the gap that could be introduced by the new
         # next_available_time of the machine.
-        machine_ops = self.dispatcher.instance.operations_by_machine[
-            scheduled_operation.machine_id
-        ]
-        unscheduled_mask = np.array(
-            [not self.dispatcher.is_scheduled(op) for op in machine_ops]
+        machine_id = scheduled_operation.machine_id
+        start = self._machine_offsets[machine_id]
+        end = self._machine_offsets[machine_id + 1]
+        job_ids = self._job_ids[start:end]
+        positions = self._positions[start:end]
+        job_next_operation_index = np.asarray(
+            self.dispatcher.job_next_operation_index
         )
+        unscheduled_mask = positions >= job_next_operation_index[job_ids]
         if np.any(unscheduled_mask):
-            if self._job_ids.size == 0:
-                job_ids = np.array([op.job_id for op in machine_ops])[
-                    unscheduled_mask
-                ]
-            else:
-                job_ids = self._job_ids[scheduled_operation.machine_id][
-                    unscheduled_mask
-                ]
-
-            if self._positions.size == 0:
-                positions = np.array(
-                    [op.position_in_job for op in machine_ops]
-                )[unscheduled_mask]
-            else:
-                positions = self._positions[scheduled_operation.machine_id][
-                    unscheduled_mask
-                ]
+            job_ids = job_ids[unscheduled_mask]
+            positions = positions[unscheduled_mask]
             old_start_times = self.earliest_start_times[job_ids, positions]
             new_start_times = np.maximum(
                 scheduled_operation.end_time, old_start_times
             )
             gaps = new_start_times - old_start_times
-
-            for job_id, position, gap in zip(job_ids, positions, gaps):
-                self.earliest_start_times[job_id, position:] += gap
+            self._propagate_gaps(job_ids, positions, gaps)
 
         self.initialize_features()
 
+    def _propagate_gaps(
+        self,
+        job_ids: NDArray[np.int_],
+        positions: NDArray[np.int_],
+        gaps: NDArray[np.float64],
+    ):
+        """Adds each gap to the earliest start time of its operation and of
+        all the operations after it in the same job.
+
+        The gaps are scattered into a delta matrix with one row per affected
+        job and accumulated along each row, so that every affected job is
+        shifted in a single vectorized operation.
+        """
+        has_gap = gaps > 0
+        if not np.any(has_gap):
+            return
+        rows, row_indices = np.unique(job_ids[has_gap], return_inverse=True)
+        deltas = np.zeros((len(rows), self.earliest_start_times.shape[1]))
+        np.add.at(deltas, (row_indices, positions[has_gap]), gaps[has_gap])
+        np.cumsum(deltas, axis=1, out=deltas)
+        self.earliest_start_times[rows] += deltas
+
     def initialize_features(self):
         """Initializes the features based on the current state of the
         dispatcher."""
+        current_time = self.dispatcher.current_time()
         for feature_type in self.features:
             if feature_type == FeatureType.OPERATIONS:
-                self._update_operation_features()
-            elif (
-                feature_type == FeatureType.MACHINES
-                and self._is_regular_instance
-            ):
-                self._update_machine_features_vectorized()
+                self._update_operation_features(current_time)
             elif feature_type == FeatureType.MACHINES:
-                self._update_machine_features()
+                self._update_machine_features(current_time)
             elif feature_type == FeatureType.JOBS:
-                self._update_job_features()
+                self._update_job_features(current_time)
 
-    def _update_operation_features(self):
+    def _update_operation_features(self, current_time: int):
         """Ravels the 2D array into a 1D array"""
-        current_time = self.dispatcher.current_time()
-        next_index = 0
-        for job_id, operations in enumerate(self.dispatcher.instance.jobs):
-            self.features[FeatureType.OPERATIONS][
-                next_index : next_index + len(operations), 0
-            ] = (
-                self.earliest_start_times[job_id, : len(operations)]
-                - current_time
-            )
-            next_index += len(operations)
-
-    def _update_machine_features(self):
-        """Picks the minimum start time of all operations that can be scheduled
-        on that machine"""
-        current_time = self.dispatcher.current_time()
-        operations_by_machine = self.dispatcher.instance.operations_by_machine
-        for machine_id, operations in enumerate(operations_by_machine):
-            min_earliest_start_time = min(
-                (
-                    self.earliest_start_times[
-                        operation.job_id, operation.position_in_job
-                    ]
-                    for operation in operations
-                    if not self.dispatcher.is_scheduled(operation)
-                ),
-                default=0,
-            )
-            self.features[FeatureType.MACHINES][machine_id, 0] = (
-                min_earliest_start_time - current_time
-            )
+        self.features[FeatureType.OPERATIONS][:, 0] = (
+            self.earliest_start_times.ravel()[self._operations_mask]
+            - current_time
+        )
 
-    def _update_machine_features_vectorized(self):
+    def _update_machine_features(self, current_time: int):
         """Picks the minimum start time of all operations that can be scheduled
         on that machine"""
-        current_time = self.dispatcher.current_time()
-        operations_by_machine = self.dispatcher.instance.operations_by_machine
-
-        # Create a mask for unscheduled operations
-        is_unscheduled = np.array(
-            [
-                [not self.dispatcher.is_scheduled(op) for op in machine_ops]
-                for machine_ops in operations_by_machine
-            ]
+        job_next_operation_index = np.asarray(
+            self.dispatcher.job_next_operation_index
         )
-
-        # Get earliest start times for all operations
-        earliest_start_times = self.earliest_start_times[
-            self._job_ids, self._positions
-        ]
-
-        # Apply mask for unscheduled operations
-        masked_start_times = np.where(
-            is_unscheduled, earliest_start_times, np.inf
+        is_unscheduled = (
+            self._positions >= job_next_operation_index[self._job_ids]
         )
-
-        # Find minimum start time for each machine
-        min_start_times = np.min(masked_start_times, axis=1)
-
-        # Handle cases where all operations are scheduled
-        min_start_times = np.where(
-            np.isinf(min_start_times), 0, min_start_times
+        min_start_times = np.full(
+            self.dispatcher.instance.num_machines, np.inf
         )
-
-        self.features[FeatureType.MACHINES][:, 0] = (
-            min_start_times - current_time
+        np.minimum.at(
+            min_start_times,
+            self._machine_ids[is_unscheduled],
+            self.earliest_start_times[
+                self._job_ids[is_unscheduled], self._positions[is_unscheduled]
+            ],
+        )
+        # Handle cases where all operations are scheduled
+        min_start_times[np.isinf(min_start_times)] = 0
+        np.subtract(
+            min_start_times,
+            current_time,
+            out=self.features[FeatureType.MACHINES][:, 0],
+            casting="unsafe",
         )
 
-    def _update_job_features(self):
+    def _update_job_features(self, current_time: int):
         """Picks the earliest start time of the next operation in the job"""
-        current_time = self.dispatcher.current_time()
-        for job_id, next_operation_idx in enumerate(
+        job_next_operation_index = np.asarray(
             self.dispatcher.job_next_operation_index
-        ):
-            job_length = len(self.dispatcher.instance.jobs[job_id])
-            if next_operation_idx == job_length:
-                continue
-            self.features[FeatureType.JOBS][job_id, 0] = (
-                self.earliest_start_times[job_id, next_operation_idx]
-                - current_time
-            )
+        )
+        # Completed jobs keep their last value
+        job_ids = np.flatnonzero(job_next_operation_index < self._job_lengths)
+        self.features[FeatureType.JOBS][job_ids, 0] = (
+            self.earliest_start_times[
+                job_ids, job_next_operation_index[job_ids]
+            ]
+            - current_time
+        )
@@ -1,7 +1,9 @@
 """Contains factory functions for creating node feature encoders."""
 
 from enum import Enum
+from typing import Final
 
+from job_shop_lib.exceptions import ValidationError
 from job_shop_lib.dispatching import DispatcherObserverConfig
 from job_shop_lib.dispatching.feature_observers import (
     IsReadyObserver,
@@ -41,6 +43,18 @@ FeatureObserverConfig = (
     | DispatcherObserverConfig[str]
 )
 
+_FEATURE_OBSERVER_MAP: Final[
+    dict[FeatureObserverType, type[FeatureObserver]]
+] = {
+    FeatureObserverType.IS_READY: IsReadyObserver,
+    FeatureObserverType.EARLIEST_START_TIME: EarliestStartTimeObserver,
+    FeatureObserverType.DURATION: DurationObserver,
+    FeatureObserverType.IS_SCHEDULED: IsScheduledObserver,
+    FeatureObserverType.POSITION_IN_JOB: PositionInJobObserver,
+    FeatureObserverType.REMAINING_OPERATIONS: RemainingOperationsObserver,
+    FeatureObserverType.IS_COMPLETED: IsCompletedObserver,
+}
+
 
 def feature_observer_factory(
     feature_creator_type: (
@@ -63,6 +77,12 @@ def feature_observer_factory(
 
     Returns:
         A node feature creator instance.
+
+    Raises:
+        ValidationError:
+            If ``feature_creator_type`` is a string or
+            :class:`FeatureObserverType` that does not correspond to any
+            feature observer.
     """
     if isinstance(feature_creator_type, DispatcherObserverConfig):
         return feature_observer_factory(
@@ -75,14 +95,14 @@ def feature_observer_factory(
     if isinstance(feature_creator_type, type):
         return feature_creator_type(**kwargs)
 
-    mapping: dict[FeatureObserverType, type[FeatureObserver]] = {
-        FeatureObserverType.IS_READY: IsReadyObserver,
-        FeatureObserverType.EARLIEST_START_TIME: EarliestStartTimeObserver,
-        FeatureObserverType.DURATION: DurationObserver,
-        FeatureObserverType.IS_SCHEDULED: IsScheduledObserver,
-        FeatureObserverType.POSITION_IN_JOB: PositionInJobObserver,
-        FeatureObserverType.REMAINING_OPERATIONS: RemainingOperationsObserver,
-        FeatureObserverType.IS_COMPLETED: IsCompletedObserver,
-    }
-    feature_creator = mapping[feature_creator_type]  # type: ignore[index]
+    try:
+        feature_creator = _FEATURE_OBSERVER_MAP[
+            feature_creator_type  # type: ignore[index]
+        ]
+    except KeyError as exc:
+        raise ValidationError(
+            f"Feature observer type {feature_creator_type} not recognized. "
+            f"Available feature observer types: "
+            f"{', '.join(_FEATURE_OBSERVER_MAP)}."
+        ) from exc
     return feature_creator(**kwargs)
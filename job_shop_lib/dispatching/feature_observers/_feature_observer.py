@@ -33,13 +33,21 @@ class FeatureObserver(DispatcherObserver):
     The advantage of using arrays is that they can be easily updated in a
     vectorized manner, which is more efficient than updating each attribute
     individually. Furthermore, machine learning models can be trained on these
-    arrays to predict the best dispatching decisions.
+    arrays to predict the best dispatching decisions. The arrays of an
+    observer are views of a single contiguous buffer, so they should be
+    updated in place rather than reassigned.
 
-    Arrays use the data type ``np.float32``. This is because most machine
+    Arrays use the data type ``np.float32`` by default. This is because most
+    machine learning frameworks expect floating point inputs. Observers whose
+    features are flags or small counts use a smaller data type (e.g.,
+    ``np.uint8``) to reduce memory traffic. The
+    :class:`CompositeFeatureObserver` always concatenates them into
+    ``np.float32`` arrays.
 
     New :class:`FeatureObservers` must inherit from this class, and re-define
     the class attributes ``_singleton`` (defualt ), ``_feature_size``
-    (default 1) and ``_supported_feature_types`` (default all feature types).
+    (default 1), ``_supported_feature_types`` (default all feature types) and
+    ``_feature_dtype`` (default ``np.float32``).
 
     Feature observers are not singleton by default. This means that more than
     one instance of the same feature observer type can be subscribed to the
@@ -49,6 +57,10 @@ class FeatureObserver(DispatcherObserver):
     operation-related features, while the second subscriber could observe the
     jobs.
 
+    Since the features only depend on the state of the dispatcher, feature
+    observers are not reset when the dispatcher is reset before any operation
+    has been scheduled since its previous reset.
+
     Args:
         dispatcher:
             The :class:`~job_shop_lib.dispatching.Dispatcher` to observe.
@@ -64,8 +76,10 @@ class FeatureObserver(DispatcherObserver):
     """
 
     _is_singleton = False
+    _reset_if_nothing_scheduled = False
     _feature_sizes: dict[FeatureType, int] | int = 1
     _supported_feature_types = list(FeatureType)
+    _feature_dtype: type[np.number] = np.float32
 
     __slots__ = {
         "features": (
@@ -76,7 +90,18 @@ class FeatureObserver(DispatcherObserver):
             "entities being observed (e.g., operations, machines, or jobs) and"
             " ``feature_size`` is the number of values being observed for each"
             " entity."
-        )
+        ),
+        "_features_buffer": (
+            "A 1D numpy array that holds the values of every feature array. "
+            "Each array in ``features`` is a contiguous view of a block of "
+            "this buffer, so all the features of the observer are stored in "
+            "a single allocation."
+        ),
+        "_feature_items": (
+            "A tuple with the ``(feature_type, array)`` pairs of "
+            "``features``. It is rebuilt every time the features are "
+            "allocated."
+        ),
     }
 
     def __init__(
@@ -92,6 +117,8 @@ class FeatureObserver(DispatcherObserver):
                 feature_type: self._feature_sizes
                 for feature_type in feature_types
             }
+        else:
+            feature_size = self._feature_sizes
         super().__init__(dispatcher, subscribe=subscribe)
 
         number_of_entities = {
@@ -106,13 +133,7 @@ class FeatureObserver(DispatcherObserver):
             )
             for feature_type in feature_types
         }
-        self.features = {
-            feature_type: np.zeros(
-                feature_dimensions[feature_type],
-                dtype=np.float32,
-            )
-            for feature_type in feature_types
-        }
+        self._allocate_features(feature_dimensions)
         self.initialize_features()
 
     @property
@@ -185,14 +206,42 @@ class FeatureObserver(DispatcherObserver):
                 ``None``, all currently used features are set to zero.
         """
         if exclude is None:
-            exclude = []
-        if isinstance(exclude, FeatureType):
-            exclude = [exclude]
+            self._features_buffer.fill(0)
+            return
+        excluded_types = (
+            frozenset((exclude,))
+            if isinstance(exclude, FeatureType)
+            else frozenset(exclude)
+        )
+        for feature_type, feature in self._feature_items:
+            if feature_type not in excluded_types:
+                feature.fill(0)
 
-        for feature_type in self.features:
-            if feature_type in exclude:
-                continue
-            self.features[feature_type][:] = 0.0
+    def _allocate_features(
+        self, feature_dimensions: dict[FeatureType, tuple[int, int]]
+    ):
+        """Allocates a single zero-filled buffer for all the features and
+        sets :attr:`features` to views of it.
+
+        Args:
+            feature_dimensions:
+                A dictionary mapping each :class:`FeatureType` to the shape
+                of its feature array.
+        """
+        total_size = sum(
+            num_entities * feature_size
+            for num_entities, feature_size in feature_dimensions.values()
+        )
+        self._features_buffer = np.zeros(total_size, dtype=self._feature_dtype)
+        self.features = {}
+        offset = 0
+        for feature_type, shape in feature_dimensions.items():
+            size = shape[0] * shape[1]
+            self.features[feature_type] = self._features_buffer[
+                offset : offset + size
+            ].reshape(shape)
+            offset += size
+        self._feature_items = tuple(self.features.items())
 
     def _get_feature_types_list(
         self,
@@ -205,18 +254,22 @@ class FeatureObserver(DispatcherObserver):
                 A list of feature types or a single feature type. If ``None``,
                 all feature types are returned.
         """
-        if isinstance(feature_types, FeatureType):
-            return [feature_types]
         if feature_types is None:
             return self._supported_feature_types
+        if isinstance(feature_types, FeatureType):
+            feature_types = [feature_types]
 
-        for feature_type in feature_types:
-            if feature_type not in self._supported_feature_types:
-                raise ValidationError(
-                    f"Feature type {feature_type} is not supported."
-                    " Supported feature types are: "
-                    f"{self._supported_feature_types}"
-                )
+        if not set(feature_types).issubset(self._supported_feature_types):
+            unsupported_types = [
+                feature_type
+                for feature_type in feature_types
+                if feature_type not in self._supported_feature_types
+            ]
+            raise ValidationError(
+                f"Feature types {unsupported_types} are not supported."
+                " Supported feature types are: "
+                f"{self._supported_feature_types}"
+            )
         return feature_types
 
     def __str__(self):
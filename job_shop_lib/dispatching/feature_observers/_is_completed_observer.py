@@ -1,5 +1,8 @@
 """Home of the `IsCompletedObserver` class."""
 
+import heapq
+import itertools
+
 import numpy as np
 
 from job_shop_lib import ScheduledOperation
@@ -39,6 +42,8 @@ class IsCompletedObserver(FeatureObserver):
             or manually updated.
     """
 
+    _feature_dtype = np.uint8
+
     __slots__ = {
         "remaining_ops_per_machine": (
             "The number of unscheduled operations per machine."
@@ -46,6 +51,17 @@ class IsCompletedObserver(FeatureObserver):
         "remaining_ops_per_job": (
             "The number of unscheduled operations per job."
         ),
+        "_remaining_ops_observer": (
+            "The :class:`RemainingOperationsObserver` used to initialize "
+            "``remaining_ops_per_machine`` and ``remaining_ops_per_job``. It "
+            "is resolved once in ``__init__``."
+        ),
+        "_uncompleted_operations_heap": (
+            "A min-heap of ``(end_time, operation_id)`` tuples with the "
+            "scheduled operations that have not been marked as completed "
+            "yet. It allows updating only the newly completed operations "
+            "after each dispatch."
+        ),
     }
 
     def __init__(
@@ -61,13 +77,35 @@ class IsCompletedObserver(FeatureObserver):
         self.remaining_ops_per_job = np.zeros(
             (dispatcher.instance.num_jobs, 1), dtype=int
         )
+        self._uncompleted_operations_heap: list[tuple[int, int]] = []
+        # It is important to get the `RemainingOperationsObserver` before
+        # calling the parent class constructor to ensure it is subscribed,
+        # and therefore updated and reset, before this observer.
+        self._remaining_ops_observer = self._get_remaining_operations_observer(
+            dispatcher, feature_types
+        )
         super().__init__(
             dispatcher,
             feature_types=feature_types,
             subscribe=subscribe,
         )
 
-    def initialize_features(self):
+    @staticmethod
+    def _get_remaining_operations_observer(
+        dispatcher: Dispatcher, feature_types: list[FeatureType]
+    ) -> RemainingOperationsObserver:
+        """Returns a :class:`RemainingOperationsObserver` subscribed to the
+        dispatcher that tracks the machine and job features in
+        ``feature_types``.
+
+        If no such observer exists, a new one is created.
+
+        Note:
+            The lookup is performed only once, when the observer is
+            initialized. Observers subscribed later to the dispatcher are
+            not taken into account.
+        """
+
         def _has_same_features(observer: DispatcherObserver) -> bool:
             if not isinstance(observer, RemainingOperationsObserver):
                 return False
@@ -76,52 +114,74 @@ class IsCompletedObserver(FeatureObserver):
                 for feature_type in remaining_ops_feature_types
             )
 
-        self.set_features_to_zero()
-
         remaining_ops_feature_types = [
             feature_type
-            for feature_type in self.features.keys()
+            for feature_type in feature_types
             if feature_type != FeatureType.OPERATIONS
         ]
-        remaining_ops_observer = self.dispatcher.create_or_get_observer(
+        return dispatcher.create_or_get_observer(
             RemainingOperationsObserver,
             condition=_has_same_features,
             feature_types=remaining_ops_feature_types,
         )
+
+    def initialize_features(self):
+        self.set_features_to_zero()
+        if FeatureType.OPERATIONS in self.features:
+            self._uncompleted_operations_heap = [
+                (
+                    scheduled_operation.end_time,
+                    scheduled_operation.operation.operation_id,
+                )
+                for scheduled_operation in itertools.chain.from_iterable(
+                    self.dispatcher.schedule.schedule
+                )
+            ]
+            heapq.heapify(self._uncompleted_operations_heap)
+            self._update_completed_operations()
         if FeatureType.JOBS in self.features:
-            self.remaining_ops_per_job = remaining_ops_observer.features[
+            self.remaining_ops_per_job = self._remaining_ops_observer.features[
                 FeatureType.JOBS
             ].copy()
         if FeatureType.MACHINES in self.features:
-            self.remaining_ops_per_machine = remaining_ops_observer.features[
-                FeatureType.MACHINES
-            ].copy()
+            self.remaining_ops_per_machine = (
+                self._remaining_ops_observer.features[
+                    FeatureType.MACHINES
+                ].copy()
+            )
 
     def reset(self):
         self.initialize_features()
 
     def update(self, scheduled_operation: ScheduledOperation):
         if FeatureType.OPERATIONS in self.features:
-            completed_operations = [
-                op.operation_id
-                for op in self.dispatcher.completed_operations()
-            ]
-            self.features[FeatureType.OPERATIONS][completed_operations, 0] = 1
+            heapq.heappush(
+                self._uncompleted_operations_heap,
+                (
+                    scheduled_operation.end_time,
+                    scheduled_operation.operation.operation_id,
+                ),
+            )
+            self._update_completed_operations()
         if FeatureType.MACHINES in self.features:
-            self.remaining_ops_per_machine[
-                scheduled_operation.operation.machines, 0
-            ] -= 1
-            is_completed = (
-                self.remaining_ops_per_machine[
-                    scheduled_operation.operation.machines, 0
-                ]
-                == 0
+            machines = scheduled_operation.operation.machines
+            remaining_ops = self.remaining_ops_per_machine[machines, 0] - 1
+            self.remaining_ops_per_machine[machines, 0] = remaining_ops
+            self.features[FeatureType.MACHINES][machines, 0] = (
+                remaining_ops == 0
             )
-            self.features[FeatureType.MACHINES][
-                scheduled_operation.operation.machines, 0
-            ] = is_completed
         if FeatureType.JOBS in self.features:
             job_id = scheduled_operation.job_id
-            self.remaining_ops_per_job[job_id, 0] -= 1
-            is_completed = self.remaining_ops_per_job[job_id, 0] == 0
-            self.features[FeatureType.JOBS][job_id, 0] = is_completed
+            remaining_ops = self.remaining_ops_per_job[job_id, 0] - 1
+            self.remaining_ops_per_job[job_id, 0] = remaining_ops
+            self.features[FeatureType.JOBS][job_id, 0] = remaining_ops == 0
+
+    def _update_completed_operations(self):
+        """Marks as completed the scheduled operations whose end time is not
+        greater than the current time."""
+        current_time = self.dispatcher.current_time()
+        heap = self._uncompleted_operations_heap
+        operations_features = self.features[FeatureType.OPERATIONS]
+        while heap and heap[0][0] <= current_time:
+            _, operation_id = heapq.heappop(heap)
+            operations_features[operation_id, 0] = 1
@@ -1,5 +1,7 @@
 """Home of the `IsReadyObserver` class."""
 
+import numpy as np
+
 from job_shop_lib.dispatching.feature_observers import (
     FeatureObserver,
     FeatureType,
@@ -10,11 +12,13 @@ class IsReadyObserver(FeatureObserver):
     """Feature creator that adds a binary feature indicating if the operation,
     machine or job is ready to be dispatched."""
 
+    _feature_dtype = np.uint8
+
     def initialize_features(self):
         self.set_features_to_zero()
-        for feature_type, feature in self.features.items():
+        for feature_type, feature in self._feature_items:
             feature_ids = self._get_ready_feature_ids(feature_type)
-            feature[feature_ids, 0] = 1.0
+            feature[feature_ids, 0] = 1
 
     def _get_ready_feature_ids(self, feature_type: FeatureType) -> list[int]:
         if feature_type == FeatureType.OPERATIONS:
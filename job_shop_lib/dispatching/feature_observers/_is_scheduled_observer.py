@@ -1,5 +1,7 @@
 """Home of the `IsScheduledObserver` class."""
 
+import numpy as np
+
 from job_shop_lib import ScheduledOperation
 from job_shop_lib.dispatching.feature_observers import (
     FeatureObserver,
@@ -22,17 +24,19 @@ class IsScheduledObserver(FeatureObserver):
     :meth:`FeatureType.MACHINES` and :meth:`FeatureType.JOBS` feature matrices.
     """
 
+    _feature_dtype = np.uint8
+
     def update(self, scheduled_operation: ScheduledOperation):
         if FeatureType.OPERATIONS in self.features:
             self.features[FeatureType.OPERATIONS][
                 scheduled_operation.operation.operation_id, 0
-            ] = 1.0
+            ] = 1
 
         ongoing_operations = self.dispatcher.ongoing_operations()
         self.set_features_to_zero(exclude=FeatureType.OPERATIONS)
         for scheduled_op in ongoing_operations:
             if FeatureType.MACHINES in self.features:
                 machine_id = scheduled_op.machine_id
-                self.features[FeatureType.MACHINES][machine_id, 0] += 1.0
+                self.features[FeatureType.MACHINES][machine_id, 0] += 1
             if FeatureType.JOBS in self.features:
-                self.features[FeatureType.JOBS][scheduled_op.job_id, 0] += 1.0
+                self.features[FeatureType.JOBS][scheduled_op.job_id, 0] += 1
@@ -1,5 +1,7 @@
 """Home of the `PositionInJobObserver` class."""
 
+import numpy as np
+
 from job_shop_lib import ScheduledOperation
 from job_shop_lib.dispatching.feature_observers import (
     FeatureObserver,
@@ -20,6 +22,7 @@ class PositionInJobObserver(FeatureObserver):
     """
 
     _supported_feature_types = [FeatureType.OPERATIONS]
+    _feature_dtype = np.int16
 
     def initialize_features(self):
         for operation in self.dispatcher.unscheduled_operations():
@@ -1,7 +1,9 @@
 """Home of the `RemainingOperationsObserver` class."""
 
+import numpy as np
+
 from job_shop_lib import ScheduledOperation
-from job_shop_lib.dispatching import UnscheduledOperationsObserver
+from job_shop_lib.dispatching import Dispatcher
 from job_shop_lib.dispatching.feature_observers import (
     FeatureObserver,
     FeatureType,
@@ -16,16 +18,66 @@ class RemainingOperationsObserver(FeatureObserver):
     """
 
     _supported_feature_types = [FeatureType.MACHINES, FeatureType.JOBS]
+    _feature_dtype = np.int32
+
+    __slots__ = {
+        "_job_lengths": "A 1D array with the number of operations per job.",
+        "_machine_ids": (
+            "A 1D array with the machine id of each (machine, operation) "
+            "pair. Operations that can be processed by more than one machine "
+            "appear once per machine."
+        ),
+        "_job_ids": (
+            "A 1D array with the job id of the operation of each entry in "
+            "``_machine_ids``."
+        ),
+        "_positions": (
+            "A 1D array with the position in job of the operation of each "
+            "entry in ``_machine_ids``."
+        ),
+    }
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        *,
+        subscribe: bool = True,
+        feature_types: list[FeatureType] | FeatureType | None = None,
+    ):
+        instance = dispatcher.instance
+        self._job_lengths = np.array([len(job) for job in instance.jobs])
+        machine_ids: list[int] = []
+        job_ids: list[int] = []
+        positions: list[int] = []
+        for job in instance.jobs:
+            for operation in job:
+                for machine_id in operation.machines:
+                    machine_ids.append(machine_id)
+                    job_ids.append(operation.job_id)
+                    positions.append(operation.position_in_job)
+        self._machine_ids = np.array(machine_ids, dtype=int)
+        self._job_ids = np.array(job_ids, dtype=int)
+        self._positions = np.array(positions, dtype=int)
+        super().__init__(
+            dispatcher, subscribe=subscribe, feature_types=feature_types
+        )
 
     def initialize_features(self):
-        unscheduled_ops_observer = self.dispatcher.create_or_get_observer(
-            UnscheduledOperationsObserver
+        job_next_operation_index = np.asarray(
+            self.dispatcher.job_next_operation_index
         )
-        for operation in unscheduled_ops_observer.unscheduled_operations:
-            if FeatureType.JOBS in self.features:
-                self.features[FeatureType.JOBS][operation.job_id, 0] += 1
-            if FeatureType.MACHINES in self.features:
-                self.features[FeatureType.MACHINES][operation.machines, 0] += 1
+        if FeatureType.JOBS in self.features:
+            self.features[FeatureType.JOBS][:, 0] = (
+                self._job_lengths - job_next_operation_index
+            )
+        if FeatureType.MACHINES in self.features:
+            is_unscheduled = (
+                self._positions >= job_next_operation_index[self._job_ids]
+            )
+            self.features[FeatureType.MACHINES][:, 0] = np.bincount(
+                self._machine_ids[is_unscheduled],
+                minlength=self.dispatcher.instance.num_machines,
+            )
 
     def update(self, scheduled_operation: ScheduledOperation):
         if FeatureType.JOBS in self.features:
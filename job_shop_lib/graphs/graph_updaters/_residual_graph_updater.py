@@ -1,5 +1,8 @@
 """Home of the `ResidualGraphUpdater` class."""
 
+import numpy as np
+from numpy.typing import NDArray
+
 from job_shop_lib import ScheduledOperation
 from job_shop_lib.exceptions import UninitializedAttributeError
 from job_shop_lib.graphs import NodeType, JobShopGraph
@@ -61,6 +64,18 @@ class ResidualGraphUpdater(GraphUpdater):
         self.remove_completed_job_nodes = remove_completed_job_nodes
         self.remove_completed_machine_nodes = remove_completed_machine_nodes
         self._initialize_is_completed_observer_attribute(dispatcher)
+        self._machines_removed_mask = np.zeros(
+            dispatcher.instance.num_machines, dtype=bool
+        )
+        self._jobs_removed_mask = np.zeros(
+            dispatcher.instance.num_jobs, dtype=bool
+        )
+        # Node ids do not change when the graph is reset because the new
+        # graph is a copy of the initial one.
+        self._machine_node_ids = self._get_node_ids(
+            job_shop_graph, NodeType.MACHINE
+        )
+        self._job_node_ids = self._get_node_ids(job_shop_graph, NodeType.JOB)
 
         # It is important to initialize the `IsCompletedObserver` before
         # calling the parent class constructor to ensure the observer is
@@ -95,6 +110,26 @@ class ResidualGraphUpdater(GraphUpdater):
                 feature_types=feature_types,
             )
 
+    @staticmethod
+    def _get_node_ids(
+        job_shop_graph: JobShopGraph, node_type: NodeType
+    ) -> NDArray[np.int32]:
+        """Returns an array with the node id of each machine or job node,
+        indexed by its ``machine_id`` or ``job_id``.
+
+        The array is empty if the graph has no nodes of the given type.
+        """
+        nodes = job_shop_graph.nodes_by_type[node_type]
+        node_ids = np.empty(len(nodes), dtype=np.int32)
+        for node in nodes:
+            entity_id = (
+                node.machine_id
+                if node_type == NodeType.MACHINE
+                else node.job_id
+            )
+            node_ids[entity_id] = node.node_id
+        return node_ids
+
     @property
     def is_completed_observer(self) -> IsCompletedObserver:
         """Returns the :class:`~job_shop_lib.dispatching.feature_observers.
@@ -109,6 +144,13 @@ class ResidualGraphUpdater(GraphUpdater):
             )
         return self._is_completed_observer
 
+    def reset(self) -> None:
+        """Resets the job shop graph and the removed machine and job
+        masks."""
+        super().reset()
+        self._machines_removed_mask[:] = False
+        self._jobs_removed_mask[:] = False
+
     def update(self, scheduled_operation: ScheduledOperation) -> None:
         """Updates the residual graph based on the completed operations."""
         remove_completed_operations(
@@ -129,26 +171,36 @@ class ResidualGraphUpdater(GraphUpdater):
 
     def _remove_completed_machine_nodes(self):
         """Removes the completed machine nodes from the graph if they are
-        not already removed."""
-
-        for machine_id, is_completed in enumerate(
-            self.is_completed_observer.features[FeatureType.MACHINES].flatten()
-        ):
-            if is_completed == 1 and not self.job_shop_graph.is_removed(
-                machine_node := self.job_shop_graph.get_machine_node(
-                    machine_id
-                )
-            ):
-                self.job_shop_graph.remove_node(machine_node.node_id)
+        not already removed.
+
+        Only the machines that have been completed since the last call are
+        visited.
+        """
+        is_completed = (
+            self.is_completed_observer.features[FeatureType.MACHINES][:, 0]
+            == 1
+        )
+        machine_ids = np.flatnonzero(
+            is_completed & ~self._machines_removed_mask
+        )
+        self._machines_removed_mask[machine_ids] = True
+        for node_id in self._machine_node_ids[machine_ids].tolist():
+            # The node could have been removed for being isolated
+            if not self.job_shop_graph.is_removed(node_id):
+                self.job_shop_graph.remove_node(node_id)
 
     def _remove_completed_job_nodes(self):
         """Removes the completed job nodes from the graph if they are not
-        already removed."""
-
-        for job_id, is_completed in enumerate(
-            self.is_completed_observer.features[FeatureType.JOBS]
-        ):
-            if is_completed == 1 and not self.job_shop_graph.is_removed(
-                job_node := self.job_shop_graph.get_job_node(job_id)
-            ):
-                self.job_shop_graph.remove_node(job_node.node_id)
+        already removed.
+
+        Only the jobs that have been completed since the last call are
+        visited.
+        """
+        is_completed = (
+            self.is_completed_observer.features[FeatureType.JOBS][:, 0] == 1
+        )
+        job_ids = np.flatnonzero(is_completed & ~self._jobs_removed_mask)
+        self._jobs_removed_mask[job_ids] = True
+        for node_id in self._job_node_ids[job_ids].tolist():
+            if not self.job_shop_graph.is_removed(node_id):
+                self.job_shop_graph.remove_node(node_id)
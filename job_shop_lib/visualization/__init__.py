@@ -8,6 +8,7 @@ from job_shop_lib.visualization._gantt_chart_video_and_gif_creation import (
     plot_gantt_chart_wrapper,
     create_video_from_frames,
     create_gif_from_frames,
+    optimize_gif,
 )
 from job_shop_lib.visualization._disjunctive_graph import (
     plot_disjunctive_graph,
@@ -31,6 +32,7 @@ __all__ = [
     "plot_gantt_chart_wrapper",
     "create_gif_from_frames",
     "create_video_from_frames",
+    "optimize_gif",
     "plot_disjunctive_graph",
     "plot_agent_task_graph",
     "three_columns_layout",
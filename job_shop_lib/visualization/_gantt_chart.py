@@ -1,15 +1,16 @@
 """Module for plotting static Gantt charts for job shop schedules."""
 
+import functools
 from typing import Optional
 
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 from matplotlib.colors import Normalize
 from matplotlib.patches import Patch
+import numpy as np
 
 from job_shop_lib import Schedule, ScheduledOperation
 
-
 _BASE_Y_POSITION = 1
 _Y_POSITION_INCREMENT = 10
 
@@ -20,6 +21,7 @@ def plot_gantt_chart(
     cmap_name: str = "viridis",
     xlim: int | None = None,
     number_of_x_ticks: int = 15,
+    ax: plt.Axes | None = None,
 ) -> tuple[Figure, plt.Axes]:
     """Plots a Gantt chart for the schedule.
 
@@ -37,8 +39,12 @@ def plot_gantt_chart(
             the schedule is used.
         number_of_x_ticks:
             The number of ticks to use in the x-axis.
+        ax:
+            An existing, empty axes to draw the chart on. If not provided, a
+            new figure and axes are created. This allows reusing the same
+            figure to plot several charts.
     """
-    fig, ax = _initialize_plot(schedule, title)
+    fig, ax = _initialize_plot(schedule, title, ax)
     legend_handles = _plot_machine_schedules(schedule, ax, cmap_name)
     _configure_legend(ax, legend_handles)
     _configure_axes(schedule, ax, xlim, number_of_x_ticks)
@@ -46,17 +52,25 @@ def plot_gantt_chart(
 
 
 def _initialize_plot(
-    schedule: Schedule, title: str | None
+    schedule: Schedule, title: str | None, ax: plt.Axes | None = None
 ) -> tuple[Figure, plt.Axes]:
     """Initializes the plot."""
-    fig, ax = plt.subplots()
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        figure = ax.get_figure()
+        # Axes of a subfigure belong to the figure that contains it
+        while figure is not None and not isinstance(figure, Figure):
+            figure = figure.get_figure()
+        assert figure is not None, "The axes must belong to a figure."
+        fig = figure
     ax.set_xlabel("Time units")
     ax.set_ylabel("Machines")
     ax.grid(True, which="both", axis="x", linestyle="--", linewidth=0.5)
     ax.yaxis.grid(False)
     if title is None:
         title = f"Gantt Chart for {schedule.instance.name} instance"
-    plt.title(title)
+    ax.set_title(title)
     return fig, ax
 
 
@@ -64,9 +78,7 @@ def _plot_machine_schedules(
     schedule: Schedule, ax: plt.Axes, cmap_name: str
 ) -> dict[int, Patch]:
     """Plots the schedules for each machine."""
-    max_job_id = schedule.instance.num_jobs - 1
-    cmap = plt.get_cmap(cmap_name, max_job_id + 1)
-    norm = Normalize(vmin=0, vmax=max_job_id)
+    job_colors = _get_job_colors(cmap_name, schedule.instance.num_jobs)
     legend_handles = {}
 
     for machine_index, machine_schedule in enumerate(schedule.schedule):
@@ -75,7 +87,7 @@ def _plot_machine_schedules(
         )
 
         for scheduled_op in machine_schedule:
-            color = cmap(norm(scheduled_op.job_id))
+            color = job_colors[scheduled_op.job_id]
             _plot_scheduled_operation(
                 ax, scheduled_op, y_position_for_machines, color
             )
@@ -87,6 +99,22 @@ def _plot_machine_schedules(
     return legend_handles
 
 
+@functools.lru_cache(maxsize=32)
+def _get_job_colors(
+    cmap_name: str, num_jobs: int
+) -> tuple[tuple[float, float, float, float], ...]:
+    """Returns the RGBA color of each job.
+
+    The result is cached because it is the same for every chart of an
+    instance (e.g., for every frame of a GIF).
+    """
+    max_job_id = num_jobs - 1
+    cmap = plt.get_cmap(cmap_name, num_jobs)
+    norm = Normalize(vmin=0, vmax=max_job_id)
+    colors = cmap(norm(np.arange(num_jobs)))
+    return tuple(tuple(color) for color in colors.tolist())
+
+
 def _plot_scheduled_operation(
     ax: plt.Axes,
     scheduled_op: ScheduledOperation,
@@ -38,6 +38,9 @@ class _GifConfigOptional(TypedDict, total=False):
     remove_frames: bool
     frames_dir: str | None
     plot_current_time: bool
+    max_workers: int
+    optimize: bool
+    use_ffmpeg: bool
 
 
 class GifConfig(_GifConfigRequired, _GifConfigOptional):
@@ -54,6 +57,7 @@ class VideoConfig(TypedDict, total=False):
     remove_frames: bool
     frames_dir: str | None
     plot_current_time: bool
+    max_workers: int
 
 
 class GanttChartCreator:
@@ -122,6 +126,10 @@ class GanttChartCreator:
                 - frames_dir: The directory to store the frames.
                 - plot_current_time: Whether to plot the current time in the
                     Gantt chart.
+                - max_workers: The number of processes used to render the
+                    frames.
+                - optimize: Whether to optimize the GIF with ``gifsicle``.
+                - use_ffmpeg: Whether to encode the GIF with ``ffmpeg``.
             video_config:
                 Configuration for creating the video. Defaults to None.
                 Valid keys are:
@@ -132,6 +140,8 @@ class GanttChartCreator:
                 - frames_dir: The directory to store the frames.
                 - plot_current_time: Whether to plot the current time in the
                     Gantt chart.
+                - max_workers: The number of processes used to render the
+                    frames.
         """
         if gif_config is None:
             gif_config = {"gif_path": None}
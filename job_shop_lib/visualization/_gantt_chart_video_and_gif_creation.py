@@ -1,15 +1,22 @@
 """Module for creating a GIF or a video of the schedule being built."""
 
+import collections
+import itertools
+import math
+import multiprocessing
 import os
 import pathlib
 import shutil
-from collections.abc import Callable
+import subprocess
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Sequence
 
-import imageio
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 import numpy as np
+from PIL import Image
 
 from job_shop_lib import (
     JobShopInstance,
@@ -21,10 +28,12 @@ from job_shop_lib.exceptions import ValidationError
 from job_shop_lib.dispatching import (
     Dispatcher,
     HistoryObserver,
+    ReadyOperationsFilter,
 )
 from job_shop_lib.dispatching.rules import DispatchingRuleSolver
 from job_shop_lib.visualization._gantt_chart import plot_gantt_chart
 
+_MAX_FRAMES_PER_CHUNK = 16
 
 PlotFunction = Callable[
     [Schedule, int | None, list[Operation] | None, int | None], Figure
@@ -54,19 +63,83 @@ def plot_gantt_chart_wrapper(
         - current_time: The current time in the schedule. If provided, a
             red vertical line is plotted at this time.
 
+        Each call returns a new figure. The function can be pickled, so it
+        can be used to render frames in parallel.
     """
+    return _GanttChartPlotFunction(title, cmap, show_available_operations)
+
+
+class _GanttChartPlotFunction:
+    """Picklable callable returned by :func:`plot_gantt_chart_wrapper`."""
+
+    def __init__(
+        self,
+        title: str | None,
+        cmap: str,
+        show_available_operations: bool,
+        reuse_figure: bool = False,
+    ):
+        self.title = title
+        self.cmap = cmap
+        self.show_available_operations = show_available_operations
+        self.reuse_figure = reuse_figure
+        self._fig: Figure | None = None
+        self._ax: plt.Axes | None = None
+        self._subplot_params: dict[str, float] = {}
+
+    def with_figure_reuse(self) -> "_GanttChartPlotFunction":
+        """Returns a copy that draws every chart on the same figure.
+
+        The figure is cleared and returned again on each call, and it is
+        only created again if it has been closed. It is meant for
+        generating frames, where each figure is rendered before the next
+        one is plotted.
+        """
+        return _GanttChartPlotFunction(
+            self.title,
+            self.cmap,
+            self.show_available_operations,
+            reuse_figure=True,
+        )
+
+    def __getstate__(self) -> dict:
+        # Figures are not sent to other processes. Each one creates its own.
+        state = self.__dict__.copy()
+        state["_fig"] = None
+        state["_ax"] = None
+        return state
 
-    def plot_function(
+    def __call__(
+        self,
         schedule: Schedule,
         makespan: int | None = None,
         available_operations: list | None = None,
         current_time: int | None = None,
     ) -> Figure:
-        fig, ax = plot_gantt_chart(
-            schedule, title=title, cmap_name=cmap, xlim=makespan
+        fig, ax = self._fig, self._ax
+        if not self.reuse_figure:
+            fig, ax = plt.subplots()
+        elif fig is None or ax is None or not plt.fignum_exists(fig.number):
+            fig, ax = plt.subplots()
+            self._fig, self._ax = fig, ax
+            self._subplot_params = {
+                name: getattr(fig.subplotpars, name)
+                for name in ("left", "right", "bottom", "top")
+            }
+        else:
+            ax.clear()
+            # Undo any layout adjustment (e.g., `tight_layout`) made for the
+            # previous chart, so that the result does not depend on it.
+            fig.subplots_adjust(**self._subplot_params)
+        plot_gantt_chart(
+            schedule,
+            title=self.title,
+            cmap_name=self.cmap,
+            xlim=makespan,
+            ax=ax,
         )
 
-        if show_available_operations and available_operations is not None:
+        if self.show_available_operations and available_operations is not None:
 
             operations_text = "\n".join(
                 str(operation) for operation in available_operations
@@ -74,7 +147,7 @@ def plot_gantt_chart_wrapper(
             text = f"Available operations:\n{operations_text}"
             # Print the available operations at the bottom right corner
             # of the Gantt chart
-            fig.text(
+            ax.text(
                 1.25,
                 0.05,
                 text,
@@ -91,8 +164,6 @@ def plot_gantt_chart_wrapper(
             ax.axvline(current_time, color="red", linestyle="--")
         return fig
 
-    return plot_function
-
 
 # Most of the arguments are optional with default values. There is no way to
 # reduce the number of arguments without losing functionality.
@@ -107,6 +178,9 @@ def create_gif(
     frames_dir: str | None = None,
     plot_current_time: bool = True,
     schedule_history: Sequence[ScheduledOperation] | None = None,
+    max_workers: int = 1,
+    optimize: bool = False,
+    use_ffmpeg: bool = False,
 ) -> None:
     """Creates a GIF of the schedule being built by the given solver.
 
@@ -130,15 +204,38 @@ def create_gif(
         fps:
             The number of frames per second in the GIF.
         remove_frames:
-            Whether to remove the frames after creating the GIF.
+            Whether to remove the frames after creating the GIF. If ``True``,
+            the frames are never written to disk: each one is rendered in
+            memory and appended to the GIF directly.
         frames_dir:
             The directory to save the frames in. If not provided,
-            `gif_path.replace(".gif", "") + "_frames"` is used.
+            `gif_path.replace(".gif", "") + "_frames"` is used. Only used
+            if ``remove_frames`` is ``False``.
         plot_current_time:
             Whether to plot a vertical line at the current time.
         schedule_history:
             A sequence of scheduled operations. If not provided, the solver
             will be used to generate the history.
+        max_workers:
+            The number of processes used to render the frames. If greater
+            than one, the frames are rendered in parallel in processes
+            started with the ``"spawn"`` method, so ``plot_function`` must
+            be picklable and scripts calling this function should be
+            guarded by ``if __name__ == "__main__":``. Only used if
+            ``remove_frames`` is ``True``. Frames are rendered in chunks of
+            at most 16, and only about ``max_workers`` chunks are rendered
+            ahead of the encoder, so memory use does not grow with the
+            number of frames. Defaults to 1 (no parallelism).
+        optimize:
+            Whether to shrink the GIF with ``gifsicle -O3`` after creating it.
+            Nothing is done if the ``gifsicle`` executable is not found.
+            Defaults to ``False``.
+        use_ffmpeg:
+            Whether to encode the GIF with ``ffmpeg``, which computes a
+            single palette from all the frames. It is only used if
+            ``remove_frames`` is ``True`` and the ``ffmpeg`` executable is
+            found. Otherwise, the GIF is encoded with Pillow. Defaults to
+            ``False``.
     """
     if gif_path is None:
         gif_path = f"{instance.name}_gantt_chart.gif"
@@ -146,24 +243,39 @@ def create_gif(
     if plot_function is None:
         plot_function = plot_gantt_chart_wrapper()
 
-    if frames_dir is None:
-        # Use the name of the GIF file as the directory name
-        frames_dir = gif_path.replace(".gif", "") + "_frames"
-    path = pathlib.Path(frames_dir)
-    path.mkdir(exist_ok=True)
-    frames_dir = str(path)
-    create_gantt_chart_frames(
-        frames_dir,
-        instance,
-        solver,
-        plot_function,
-        plot_current_time,
-        schedule_history,
-    )
-    create_gif_from_frames(frames_dir, gif_path, fps)
-
+    ffmpeg = shutil.which("ffmpeg") if use_ffmpeg else None
     if remove_frames:
-        shutil.rmtree(frames_dir)
+        images = _create_gantt_chart_images(
+            instance,
+            solver,
+            plot_function,
+            plot_current_time,
+            schedule_history,
+            max_workers,
+        )
+        if ffmpeg is not None:
+            _create_gif_with_ffmpeg(ffmpeg, images, gif_path, fps)
+        else:
+            _create_gif_with_pillow(images, gif_path, fps)
+    else:
+        if frames_dir is None:
+            # Use the name of the GIF file as the directory name
+            frames_dir = gif_path.replace(".gif", "") + "_frames"
+        path = pathlib.Path(frames_dir)
+        path.mkdir(exist_ok=True)
+        frames_dir = str(path)
+        create_gantt_chart_frames(
+            frames_dir,
+            instance,
+            solver,
+            plot_function,
+            plot_current_time,
+            schedule_history,
+        )
+        create_gif_from_frames(frames_dir, gif_path, fps)
+
+    if optimize:
+        optimize_gif(gif_path)
 
 
 # Most of the arguments are optional with default values. There is no way to
@@ -179,6 +291,7 @@ def create_gantt_chart_video(
     frames_dir: str | None = None,
     plot_current_time: bool = True,
     schedule_history: Sequence[ScheduledOperation] | None = None,
+    max_workers: int = 1,
 ) -> None:
     """Creates a GIF of the schedule being built by the given solver.
 
@@ -198,15 +311,28 @@ def create_gantt_chart_video(
         fps:
             The number of frames per second in the GIF.
         remove_frames:
-            Whether to remove the frames after creating the GIF.
+            Whether to remove the frames after creating the video. If
+            ``True``, the frames are never written to disk: each one is
+            rendered in memory and appended to the video directly.
         frames_dir:
             The directory to save the frames in. If not provided,
-            `name_without_the_extension` + "_frames"` is used.
+            `name_without_the_extension` + "_frames"` is used. Only used if
+            ``remove_frames`` is ``False``.
         plot_current_time:
             Whether to plot a vertical line at the current time.
         schedule_history:
             A sequence of scheduled operations. If not provided, the solver
             will be used to generate the history.
+        max_workers:
+            The number of processes used to render the frames. If greater
+            than one, the frames are rendered in parallel in processes
+            started with the ``"spawn"`` method, so ``plot_function`` must
+            be picklable and scripts calling this function should be
+            guarded by ``if __name__ == "__main__":``. Only used if
+            ``remove_frames`` is ``True``. Frames are rendered in chunks of
+            at most 16, and only about ``max_workers`` chunks are rendered
+            ahead of the encoder, so memory use does not grow with the
+            number of frames. Defaults to 1 (no parallelism).
     """
     if video_path is None:
         video_path = f"{instance.name}_gantt_chart.mp4"
@@ -214,6 +340,23 @@ def create_gantt_chart_video(
     if plot_function is None:
         plot_function = plot_gantt_chart_wrapper()
 
+    if remove_frames:
+        import imageio  # pylint: disable=import-outside-toplevel
+
+        with imageio.get_writer(video_path, fps=fps) as writer:
+            for image in _create_gantt_chart_images(
+                instance,
+                solver,
+                plot_function,
+                plot_current_time,
+                schedule_history,
+                max_workers,
+            ):
+                writer.append_data(  # type: ignore[attr-defined]
+                    resize_image_to_macro_block(image)
+                )
+        return
+
     if frames_dir is None:
         extension = video_path.split(".")[-1]
         frames_dir = video_path.replace(f".{extension}", "") + "_frames"
@@ -230,9 +373,6 @@ def create_gantt_chart_video(
     )
     create_video_from_frames(frames_dir, video_path, fps)
 
-    if remove_frames:
-        shutil.rmtree(frames_dir)
-
 
 def create_gantt_chart_frames(
     frames_dir: str,
@@ -261,49 +401,296 @@ def create_gantt_chart_frames(
         scheduled_history:
             A sequence of scheduled operations. If not provided, the solver
     """
+    for i, figure in enumerate(
+        _create_gantt_chart_figures(
+            instance,
+            solver,
+            plot_function,
+            plot_current_time,
+            schedule_history,
+        ),
+        start=1,
+    ):
+        _save_frame(figure, frames_dir, i)
+
+
+def _create_gantt_chart_figures(
+    instance: JobShopInstance,
+    solver: DispatchingRuleSolver | None,
+    plot_function: PlotFunction,
+    plot_current_time: bool = True,
+    schedule_history: Sequence[ScheduledOperation] | None = None,
+) -> Iterator[Figure]:
+    """Returns an iterator over the Gantt chart figures of the schedule
+    being built, one per dispatched operation.
+
+    The arguments are validated eagerly, before any figure is created. See
+    :func:`create_gantt_chart_frames` for a description of them.
+    """
+    schedule_history, makespan, ready_operations_filter = (
+        _get_schedule_history(instance, solver, schedule_history)
+    )
+    dispatcher = Dispatcher(
+        instance, ready_operations_filter=ready_operations_filter
+    )
+    return _plot_schedule_history(
+        dispatcher,
+        schedule_history,
+        plot_function,
+        makespan,
+        plot_current_time,
+    )
+
+
+def _create_gantt_chart_images(
+    instance: JobShopInstance,
+    solver: DispatchingRuleSolver | None,
+    plot_function: PlotFunction,
+    plot_current_time: bool = True,
+    schedule_history: Sequence[ScheduledOperation] | None = None,
+    max_workers: int = 1,
+) -> Iterator[np.ndarray]:
+    """Returns an iterator over the rendered frames (RGB arrays) of the
+    schedule being built, in order.
+
+    If ``max_workers`` is greater than one, the frames are split into
+    contiguous chunks that are rendered in parallel by a pool of processes.
+    Each process replays the schedule history up to the first frame of its
+    chunk, so only the instance and the history need to be sent to it.
+    """
+    if max_workers <= 1:
+        return (
+            _figure_to_image(figure)
+            for figure in _create_gantt_chart_figures(
+                instance,
+                solver,
+                plot_function,
+                plot_current_time,
+                schedule_history,
+            )
+        )
+
+    schedule_history, makespan, ready_operations_filter = (
+        _get_schedule_history(instance, solver, schedule_history)
+    )
+    num_frames = len(schedule_history)
+    # A few chunks per worker to balance the load between them, but small
+    # enough to bound the number of frames held in memory
+    chunk_size = max(
+        1,
+        min(
+            math.ceil(num_frames / (4 * max_workers)),
+            _MAX_FRAMES_PER_CHUNK,
+        ),
+    )
+    starts = range(0, num_frames, chunk_size)
+    stops = [min(start + chunk_size, num_frames) for start in starts]
+    return _render_frames_in_parallel(
+        max_workers,
+        instance,
+        ready_operations_filter,
+        schedule_history,
+        plot_function,
+        makespan,
+        plot_current_time,
+        starts,
+        stops,
+    )
+
+
+# pylint: disable=too-many-arguments
+def _render_frames_in_parallel(
+    max_workers: int,
+    instance: JobShopInstance,
+    ready_operations_filter: ReadyOperationsFilter | None,
+    schedule_history: Sequence[ScheduledOperation],
+    plot_function: PlotFunction,
+    makespan: int,
+    plot_current_time: bool,
+    starts: Sequence[int],
+    stops: Sequence[int],
+) -> Iterator[np.ndarray]:
+    """Renders the chunks ``[start, stop)`` of frames in a process pool and
+    yields the frames in order.
+
+    Only ``max_workers`` chunks are submitted ahead of the one being
+    yielded, so that frames are not rendered much faster than they are
+    consumed and the memory used is bounded.
+    """
+    chunk_bounds = zip(starts, stops)
+    pending: collections.deque[Future[list[np.ndarray]]] = collections.deque()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+
+        def submit_next_chunk() -> None:
+            bounds = next(chunk_bounds, None)
+            if bounds is None:
+                return
+            pending.append(
+                executor.submit(
+                    _render_frames,
+                    instance,
+                    ready_operations_filter,
+                    schedule_history,
+                    plot_function,
+                    makespan,
+                    plot_current_time,
+                    *bounds,
+                )
+            )
+
+        for _ in range(max_workers):
+            submit_next_chunk()
+        while pending:
+            chunk = pending.popleft().result()
+            submit_next_chunk()
+            yield from chunk
+
+
+# pylint: disable=too-many-arguments
+def _render_frames(
+    instance: JobShopInstance,
+    ready_operations_filter: ReadyOperationsFilter | None,
+    schedule_history: Sequence[ScheduledOperation],
+    plot_function: PlotFunction,
+    makespan: int,
+    plot_current_time: bool,
+    start: int,
+    stop: int,
+) -> list[np.ndarray]:
+    """Renders the frames with indices in ``[start, stop)``.
+
+    It is executed in a worker process by :func:`_render_frames_in_parallel`.
+    """
+    dispatcher = Dispatcher(
+        instance, ready_operations_filter=ready_operations_filter
+    )
+    for scheduled_operation in schedule_history[:start]:
+        dispatcher.dispatch(
+            scheduled_operation.operation, scheduled_operation.machine_id
+        )
+    return [
+        _figure_to_image(figure)
+        for figure in _plot_schedule_history(
+            dispatcher,
+            schedule_history[start:stop],
+            plot_function,
+            makespan,
+            plot_current_time,
+        )
+    ]
+
+
+def _get_schedule_history(
+    instance: JobShopInstance,
+    solver: DispatchingRuleSolver | None,
+    schedule_history: Sequence[ScheduledOperation] | None,
+) -> tuple[Sequence[ScheduledOperation], int, ReadyOperationsFilter | None]:
+    """Returns the history of scheduled operations to plot, the makespan
+    of the final schedule and the ready operations filter to use.
+
+    Raises:
+        ValidationError:
+            If both or none of ``solver`` and ``schedule_history`` are
+            provided.
+    """
     if solver is not None and schedule_history is None:
         dispatcher = Dispatcher(
             instance, ready_operations_filter=solver.ready_operations_filter
         )
         history_tracker = HistoryObserver(dispatcher)
         makespan = solver.solve(instance, dispatcher).makespan()
-        dispatcher.unsubscribe(history_tracker)
-        dispatcher.reset()
-        schedule_history = history_tracker.history
-    elif schedule_history is not None and solver is None:
-        dispatcher = Dispatcher(instance)
+        return (
+            history_tracker.history,
+            makespan,
+            solver.ready_operations_filter,
+        )
+    if schedule_history is not None and solver is None:
         makespan = max(
             scheduled_operation.end_time
             for scheduled_operation in schedule_history
         )
-    elif schedule_history is not None and solver is not None:
+        return schedule_history, makespan, None
+    if schedule_history is not None and solver is not None:
         raise ValidationError(
             "Only one of 'solver' and 'history' should be provided."
         )
-    else:
-        raise ValidationError(
-            "Either 'solver' or 'history' should be provided."
-        )
+    raise ValidationError("Either 'solver' or 'history' should be provided.")
 
-    for i, scheduled_operation in enumerate(schedule_history, start=1):
-        dispatcher.dispatch(
-            scheduled_operation.operation, scheduled_operation.machine_id
-        )
-        current_time = (
-            None if not plot_current_time else dispatcher.current_time()
-        )
-        fig = plot_function(
-            dispatcher.schedule,
-            makespan,
-            dispatcher.ready_operations(),
-            current_time,
-        )
-        _save_frame(fig, frames_dir, i)
+
+def _plot_schedule_history(
+    dispatcher: Dispatcher,
+    schedule_history: Sequence[ScheduledOperation],
+    plot_function: PlotFunction,
+    makespan: int,
+    plot_current_time: bool,
+) -> Iterator[Figure]:
+    """Dispatches each operation of the history and yields the Gantt chart
+    of the resulting partial schedule.
+
+    Each figure must be used (e.g., saved) before the next one is
+    requested. The default plot function is replaced by a copy that reuses
+    a single figure, which belongs to this generator. Since other plot
+    functions may also return the same figure every time, a figure is only
+    closed once a different one is returned or all the frames have been
+    yielded.
+    """
+    if isinstance(plot_function, _GanttChartPlotFunction):
+        plot_function = plot_function.with_figure_reuse()
+    previous_fig: Figure | None = None
+    try:
+        for scheduled_operation in schedule_history:
+            dispatcher.dispatch(
+                scheduled_operation.operation, scheduled_operation.machine_id
+            )
+            current_time = (
+                None if not plot_current_time else dispatcher.current_time()
+            )
+            fig = plot_function(
+                dispatcher.schedule,
+                makespan,
+                dispatcher.ready_operations(),
+                current_time,
+            )
+            if previous_fig is not None and fig is not previous_fig:
+                plt.close(previous_fig)
+            previous_fig = fig
+            yield fig
+    finally:
+        if previous_fig is not None:
+            plt.close(previous_fig)
 
 
 def _save_frame(figure: Figure, frames_dir: str, number: int) -> None:
-    figure.savefig(f"{frames_dir}/frame_{number:02d}.png", bbox_inches="tight")
-    plt.close(figure)
+    # `tight_layout` is cheaper than `bbox_inches="tight"`, which renders the
+    # figure twice, and keeps the size of every frame the same.
+    figure.tight_layout()
+    # Six digits so that the frames are sorted correctly by name. The fastest
+    # zlib level is used because compression takes a noticeable part of
+    # the saving time, and PNG is lossless regardless of the level.
+    figure.savefig(
+        f"{frames_dir}/frame_{number:06d}.png",
+        pil_kwargs={"compress_level": 1},
+    )
+
+
+def _figure_to_image(figure: Figure) -> np.ndarray:
+    """Renders the figure with the Agg backend and returns its RGB pixels,
+    without encoding them to any image format.
+
+    The layout is tightened on every frame so that elements placed outside
+    the axes (e.g., the legend or the available operations), which grow as
+    the schedule is built, are not cropped.
+    """
+    figure.tight_layout()
+    canvas = figure.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    # The buffer is overwritten by the next draw, so it must be copied.
+    return np.asarray(canvas.buffer_rgba())[..., :3].copy()
 
 
 def create_gif_from_frames(
@@ -323,8 +710,121 @@ def create_gif_from_frames(
             the GIF will loop indefinitely. If set to 1, the GIF will loop
             once. Added in version 0.6.0.
     """
-    images = _load_images(frames_dir)
-    imageio.mimsave(gif_path, images, fps=fps, loop=loop)
+    _create_gif_with_pillow(_read_images(frames_dir), gif_path, fps, loop)
+
+
+def _create_gif_with_pillow(
+    images: Iterable[np.ndarray],
+    gif_path: str,
+    fps: int,
+    loop: int = 0,
+) -> None:
+    """Quantizes each frame to 256 colors and encodes them as a GIF.
+
+    The fast octree quantizer is much cheaper than the median cut that
+    Pillow uses by default when saving RGB images as GIF frames. Frames
+    are consumed one at a time, and Pillow only keeps the (cropped)
+    difference between consecutive ones.
+    """
+    frames = (
+        Image.fromarray(image[..., :3]).quantize(
+            method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+        )
+        for image in images
+    )
+    first_frame = next(frames, None)
+    if first_frame is None:
+        return
+    first_frame.save(
+        gif_path,
+        save_all=True,
+        append_images=frames,
+        duration=1000 / fps,
+        loop=loop,
+    )
+
+
+def _create_gif_with_ffmpeg(
+    ffmpeg: str,
+    images: Iterable[np.ndarray],
+    gif_path: str,
+    fps: int,
+    loop: int = 0,
+) -> None:
+    """Pipes the raw RGB frames to ``ffmpeg``, which generates a palette
+    from all of them and uses it to encode the GIF.
+
+    All the images must have the same shape.
+    """
+    images = iter(images)
+    first_image = next(images, None)
+    if first_image is None:
+        return
+    height, width = first_image.shape[:2]
+    command = _get_ffmpeg_gif_command(
+        ffmpeg, width, height, fps, loop, gif_path
+    )
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+        assert process.stdin is not None
+        for image in itertools.chain([first_image], images):
+            process.stdin.write(np.ascontiguousarray(image[..., :3]).tobytes())
+        process.stdin.close()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+# pylint: disable=too-many-arguments
+def _get_ffmpeg_gif_command(
+    ffmpeg: str, width: int, height: int, fps: int, loop: int, gif_path: str
+) -> list[str]:
+    """Returns the ``ffmpeg`` command that reads raw RGB frames of the given
+    size from its standard input and writes them as a GIF."""
+    return [
+        ffmpeg,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+        "-vf",
+        "split[a][b];[a]palettegen[p];[b][p]paletteuse",
+        "-loop",
+        str(loop),
+        gif_path,
+    ]
+
+
+def optimize_gif(gif_path: str) -> bool:
+    """Optimizes the GIF in place with ``gifsicle``, if it is installed.
+
+    The optimization (``-O3``) is lossless: each frame is cropped to the
+    area that changed and compressed again.
+
+    Args:
+        gif_path:
+            The path of the GIF file to optimize.
+
+    Returns:
+        Whether the GIF was optimized. ``False`` if ``gifsicle`` is not
+        installed or failed.
+    """
+    gifsicle = shutil.which("gifsicle")
+    if gifsicle is None:
+        return False
+    result = subprocess.run(
+        [gifsicle, "--batch", "-O3", gif_path],
+        check=False,
+        capture_output=True,
+    )
+    return result.returncode == 0
 
 
 def create_video_from_frames(
@@ -340,14 +840,15 @@ def create_video_from_frames(
         fps:
             The number of frames per second.
     """
-    images = _load_images(frames_dir)
-    resized_images = [
-        resize_image_to_macro_block(image, macro_block_size=macro_block_size)
-        for image in images
-    ]
-    imageio.mimsave(
-        gif_path, resized_images, fps=fps  # type: ignore[arg-type]
-    )
+    import imageio  # pylint: disable=import-outside-toplevel
+
+    with imageio.get_writer(gif_path, fps=fps) as writer:
+        for image in _read_images(frames_dir):
+            writer.append_data(  # type: ignore[attr-defined]
+                resize_image_to_macro_block(
+                    image, macro_block_size=macro_block_size
+                )
+            )
 
 
 def resize_image_to_macro_block(
@@ -380,9 +881,12 @@ def resize_image_to_macro_block(
     return image
 
 
-def _load_images(frames_dir: str) -> list:
-    frames = [
-        os.path.join(frames_dir, frame)
-        for frame in sorted(os.listdir(frames_dir))
-    ]
-    return [imageio.imread(frame) for frame in frames]
+def _read_images(frames_dir: str) -> Iterator[np.ndarray]:
+    """Yields the images in the directory, sorted by file name, reading each
+    one only when it is requested."""
+    import imageio.v3 as iio  # pylint: disable=import-outside-toplevel
+
+    with os.scandir(frames_dir) as entries:
+        frames = sorted(entry.path for entry in entries)
+    for frame in frames:
+        yield iio.imread(frame)
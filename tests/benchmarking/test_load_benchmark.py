@@ -18,6 +18,12 @@ def test_load_benchmark_instance():
     assert ft06.name == ft06_from_file.name
 
 
+def test_load_benchmark_instance_is_cached():
+    ft06 = load_benchmark_instance("ft06")
+    assert load_benchmark_instance("ft06") is ft06
+    assert load_all_benchmark_instances()["ft06"] is ft06
+
+
 def test_load_all_benchmark_instances():
     instances = load_all_benchmark_instances()
     assert len(instances) == 162
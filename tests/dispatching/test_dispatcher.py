@@ -3,6 +3,7 @@ import pytest
 from job_shop_lib import JobShopInstance
 from job_shop_lib.dispatching import (
     Dispatcher,
+    DispatcherObserver,
 )
 from job_shop_lib.dispatching.rules import (
     DispatchingRuleSolver,
@@ -74,6 +75,44 @@ def test_reset(example_job_shop_instance: JobShopInstance):
     assert dispatcher.job_next_operation_index == [0, 0, 0]
 
 
+class _ResetCounterObserver(DispatcherObserver):
+    def __init__(self, dispatcher: Dispatcher):
+        super().__init__(dispatcher)
+        self.num_resets = 0
+
+    def update(self, scheduled_operation):
+        pass
+
+    def reset(self):
+        self.num_resets += 1
+
+
+class _FeatureResetCounterObserver(_ResetCounterObserver):
+    _reset_if_nothing_scheduled = False
+
+
+def test_reset_skips_feature_observers_if_nothing_was_scheduled(
+    example_job_shop_instance: JobShopInstance,
+):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    observer = _ResetCounterObserver(dispatcher)
+    feature_observer = _FeatureResetCounterObserver(dispatcher)
+
+    dispatcher.reset()
+    assert observer.num_resets == 1
+    assert feature_observer.num_resets == 0
+
+    first_operation = example_job_shop_instance.jobs[0][0]
+    dispatcher.dispatch(first_operation, first_operation.machine_id)
+    dispatcher.reset()
+    assert observer.num_resets == 2
+    assert feature_observer.num_resets == 1
+
+    dispatcher.reset()
+    assert observer.num_resets == 3
+    assert feature_observer.num_resets == 1
+
+
 def test_is_operation_ready(example_job_shop_instance: JobShopInstance):
     dispatcher = Dispatcher(example_job_shop_instance)
 
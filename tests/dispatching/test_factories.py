@@ -19,6 +19,9 @@ from job_shop_lib.dispatching.feature_observers import (
     IsCompletedObserver,
     FeatureType,
     FeatureObserver,
+    FeatureObserverType,
+    EarliestStartTimeObserver,
+    feature_observer_factory,
 )
 
 
@@ -96,5 +99,20 @@ def test_dispatching_rule_factory():
         dispatching_rule_factory("unknown_rule")
 
 
+def test_feature_observer_factory(example_job_shop_instance: JobShopInstance):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    observer = feature_observer_factory(
+        FeatureObserverType.EARLIEST_START_TIME, dispatcher=dispatcher
+    )
+    assert isinstance(observer, EarliestStartTimeObserver)
+    observer = feature_observer_factory(
+        "earliest_start_time", dispatcher=dispatcher, subscribe=False
+    )
+    assert isinstance(observer, EarliestStartTimeObserver)
+
+    with pytest.raises(ValidationError):
+        feature_observer_factory("unknown_observer", dispatcher=dispatcher)
+
+
 if __name__ == "__main__":
     pytest.main(["-vv", "tests/dispatching/test_factories.py"])
@@ -1,4 +1,9 @@
-from job_shop_lib import JobShopInstance
+import numpy as np
+
+import pytest
+
+from job_shop_lib import JobShopInstance, Operation
+from job_shop_lib.exceptions import ValidationError
 from job_shop_lib.generation import GeneralInstanceGenerator
 from job_shop_lib.dispatching.feature_observers import (
     feature_observer_factory,
@@ -9,6 +14,7 @@ from job_shop_lib.dispatching.feature_observers import (
     EarliestStartTimeObserver,
     FeatureObserver,
     IsCompletedObserver,
+    PositionInJobObserver,
 )
 
 from job_shop_lib.dispatching import (
@@ -416,7 +422,137 @@ def test_is_completed_observer_with_random_instances():
         test_is_completed_observer(instance)
 
 
-if __name__ == "__main__":
-    import pytest
+def test_is_completed_observer_after_reset(
+    example_job_shop_instance: JobShopInstance,
+):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    is_completed_observer = IsCompletedObserver(dispatcher)
+    solver = DispatchingRuleSolver(dispatching_rule="most_work_remaining")
+    solver.solve(example_job_shop_instance, dispatcher)
+    dispatcher.reset()
+
+    num_operations = example_job_shop_instance.num_operations
+    assert is_completed_observer.remaining_ops_per_job.sum() == num_operations
+    assert (
+        is_completed_observer.remaining_ops_per_machine.sum() == num_operations
+    )
+
+    solver.solve(example_job_shop_instance, dispatcher)
+    for feature_type in FeatureType:
+        assert all(is_completed_observer.features[feature_type] == 1)
+
+
+def test_feature_observers_after_reset_with_nothing_scheduled(
+    example_job_shop_instance: JobShopInstance,
+):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    observers = [
+        feature_observer_factory(observer_type, dispatcher=dispatcher)
+        for observer_type in FeatureObserverType
+        if observer_type != FeatureObserverType.COMPOSITE
+    ]
+    composite_observer = CompositeFeatureObserver(dispatcher)
+    previous_features = dict(composite_observer.features)
+    for feature_matrix in previous_features.values():
+        feature_matrix[:] = -1
+
+    dispatcher.reset()
+
+    expected_dispatcher = Dispatcher(example_job_shop_instance)
+    expected_observers = [
+        feature_observer_factory(observer_type, dispatcher=expected_dispatcher)
+        for observer_type in FeatureObserverType
+        if observer_type != FeatureObserverType.COMPOSITE
+    ]
+    expected_composite_observer = CompositeFeatureObserver(expected_dispatcher)
+    for observer, expected_observer in zip(observers, expected_observers):
+        for feature_type, feature_matrix in observer.features.items():
+            assert np.array_equal(
+                feature_matrix, expected_observer.features[feature_type]
+            )
+    for feature_type, feature_matrix in composite_observer.features.items():
+        assert feature_matrix is not previous_features[feature_type]
+        assert np.array_equal(
+            feature_matrix, expected_composite_observer.features[feature_type]
+        )
+
+
+def test_earliest_start_time_observer_uneven_machine_loads():
+    # Every job has the same number of operations, but machines do not
+    instance = JobShopInstance(
+        [
+            [Operation(0, 1), Operation(0, 2)],
+            [Operation(1, 1), Operation(0, 3)],
+        ]
+    )
+    dispatcher = Dispatcher(instance)
+    observer = EarliestStartTimeObserver(dispatcher)
+    assert observer.features[FeatureType.OPERATIONS].ravel().tolist() == [
+        0.0,
+        1.0,
+        0.0,
+        1.0,
+    ]
+    assert observer.features[FeatureType.MACHINES].ravel().tolist() == [
+        0.0,
+        0.0,
+    ]
+
+    solver = DispatchingRuleSolver(dispatching_rule="most_work_remaining")
+    solver.solve(instance, dispatcher)
+    assert observer.features[FeatureType.MACHINES].ravel().tolist() == [
+        -6.0,
+        -6.0,
+    ]
+
 
+def test_feature_observers_dtypes(example_job_shop_instance: JobShopInstance):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    expected_dtypes = {
+        FeatureObserverType.IS_READY: np.uint8,
+        FeatureObserverType.EARLIEST_START_TIME: np.float32,
+        FeatureObserverType.DURATION: np.float32,
+        FeatureObserverType.IS_SCHEDULED: np.uint8,
+        FeatureObserverType.POSITION_IN_JOB: np.int16,
+        FeatureObserverType.REMAINING_OPERATIONS: np.int32,
+        FeatureObserverType.IS_COMPLETED: np.uint8,
+    }
+    feature_observers = [
+        feature_observer_factory(observer_type, dispatcher=dispatcher)
+        for observer_type in expected_dtypes
+    ]
+    for observer, expected_dtype in zip(
+        feature_observers, expected_dtypes.values()
+    ):
+        for feature in observer.features.values():
+            assert feature.dtype == expected_dtype
+
+    composite = CompositeFeatureObserver(
+        dispatcher, feature_observers=feature_observers
+    )
+    solver = DispatchingRuleSolver("most_work_remaining")
+    solver.solve(example_job_shop_instance, dispatcher)
+    for feature in composite.features.values():
+        assert feature.dtype == np.float32
+    is_completed_observer = feature_observers[-1]
+    for feature in is_completed_observer.features.values():
+        assert np.all(feature == 1)
+
+
+def test_unsupported_feature_types(example_job_shop_instance: JobShopInstance):
+    dispatcher = Dispatcher(example_job_shop_instance)
+    with pytest.raises(ValidationError):
+        PositionInJobObserver(dispatcher, feature_types=FeatureType.JOBS)
+    with pytest.raises(ValidationError):
+        PositionInJobObserver(
+            dispatcher,
+            feature_types=[FeatureType.OPERATIONS, FeatureType.MACHINES],
+        )
+    observer = PositionInJobObserver(
+        dispatcher, feature_types=[FeatureType.OPERATIONS]
+    )
+    assert list(observer.features) == [FeatureType.OPERATIONS]
+
+
+if __name__ == "__main__":
     pytest.main(["-vv", __file__])
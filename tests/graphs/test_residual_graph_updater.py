@@ -86,6 +86,24 @@ def test_removes_all_nodes_agent_task_graph():
     _verify_all_nodes_removed(job_shop_graph)
 
 
+def test_removes_all_nodes_after_reset(
+    example_job_shop_instance: JobShopInstance,
+):
+    job_shop_graph = build_agent_task_graph(example_job_shop_instance)
+    dispatcher = Dispatcher(example_job_shop_instance)
+    residual_graph_updater = ResidualGraphUpdater(dispatcher, job_shop_graph)
+    solver = DispatchingRuleSolver(dispatching_rule="most_work_remaining")
+
+    solver.solve(dispatcher.instance, dispatcher)
+    _verify_all_nodes_removed(residual_graph_updater.job_shop_graph)
+
+    dispatcher.reset()
+    assert not any(residual_graph_updater.job_shop_graph.removed_nodes)
+
+    solver.solve(dispatcher.instance, dispatcher)
+    _verify_all_nodes_removed(residual_graph_updater.job_shop_graph)
+
+
 def test_initialization(example_job_shop_instance: JobShopInstance):
     job_shop_graph = build_agent_task_graph(example_job_shop_instance)
     dispatcher = Dispatcher(example_job_shop_instance)
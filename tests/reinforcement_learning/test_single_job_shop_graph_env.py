@@ -7,17 +7,21 @@ from job_shop_lib.reinforcement_learning import (
     ObservationSpaceKey,
     ObservationDict,
 )
+from job_shop_lib.dispatching import DispatcherObserverConfig
+from job_shop_lib.dispatching.feature_observers import (
+    FeatureObserverType,
+    FeatureType,
+)
+from job_shop_lib.graphs import build_disjunctive_graph
+from job_shop_lib.benchmarking import load_benchmark_instance
 
 
 def random_action(observation: ObservationDict) -> tuple[int, int]:
-    ready_operations = []
-    for operation_id, is_ready in enumerate(
-        observation[ObservationSpaceKey.JOBS.value].ravel()
-    ):
-        if is_ready == 1.0:
-            ready_operations.append(operation_id)
-
-    operation_id = random.choice(ready_operations)
+    ready_operations = np.flatnonzero(
+        observation[ObservationSpaceKey.JOBS.value].ravel() == 1.0
+    )
+
+    operation_id = random.choice(ready_operations.tolist())
     machine_id = -1  # We can use -1 if each operation can only be scheduled
     # in one machine.
     return (operation_id, machine_id)
@@ -58,6 +62,9 @@ def test_edge_index_padding(
     single_job_shop_graph_env_ft06: SingleJobShopGraphEnv,
 ):
     env = single_job_shop_graph_env_ft06
+    num_edges = env.observation_space[  # type: ignore[index]
+        ObservationSpaceKey.EDGE_INDEX.value
+    ].shape[1]
 
     done = False
     obs, _ = env.reset()
@@ -66,18 +73,12 @@ def test_edge_index_padding(
         obs, _, done, *_ = env.step(action)
 
         edge_index = obs[ObservationSpaceKey.EDGE_INDEX.value]
-        num_edges = env.observation_space[  # type: ignore[index]
-            ObservationSpaceKey.EDGE_INDEX.value
-        ].shape[1]
         assert edge_index.shape == (2, num_edges)
 
         padding_mask = edge_index == -1
-        if np.any(padding_mask):
-            # Ensure all padding is at the end
-            for row in padding_mask:
-                padding_start = np.argmax(row)
-                if padding_start > 0:
-                    assert np.all(row[padding_start:])
+        # Ensure all padding is at the end (the mask never goes from
+        # True to False along a row)
+        assert np.all(np.diff(padding_mask.view(np.int8), axis=1) >= 0)
 
     removed_nodes = np.all(obs[ObservationSpaceKey.REMOVED_NODES.value])
     assert np.all(removed_nodes)
@@ -107,6 +108,32 @@ def test_all_nodes_removed(
         raise
 
 
+def test_consecutive_resets_return_new_arrays():
+    instance = load_benchmark_instance("ft06")
+    env = SingleJobShopGraphEnv(
+        job_shop_graph=build_disjunctive_graph(instance),
+        feature_observer_configs=[
+            DispatcherObserverConfig(
+                FeatureObserverType.DURATION,
+                kwargs={"feature_types": [FeatureType.OPERATIONS]},
+            ),
+            DispatcherObserverConfig(
+                FeatureObserverType.IS_READY,
+                kwargs={"feature_types": [FeatureType.OPERATIONS]},
+            ),
+        ],
+    )
+    key = FeatureType.OPERATIONS.value
+    first_obs, _ = env.reset()
+    expected_features = first_obs[key].copy()
+    first_obs[key][:] = 999
+
+    second_obs, _ = env.reset()
+
+    assert second_obs[key] is not first_obs[key]
+    assert np.array_equal(second_obs[key], expected_features)
+
+
 if __name__ == "__main__":
     import pytest
 
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from job_shop_lib import JobShopInstance, Operation
 
@@ -49,6 +50,38 @@ def test_from_matrices(job_shop_instance: JobShopInstance):
     assert new_instance.metadata == metadata
 
 
+def test_from_matrices_with_arrays():
+    duration_matrix = np.array([[1, 2, 3], [4, 5, 6]])
+    machines_matrix = np.array([[0, 1, 2], [2, 1, 0]])
+
+    instance = JobShopInstance.from_matrices(
+        duration_matrix=duration_matrix, machines_matrix=machines_matrix
+    )
+
+    assert instance.durations_matrix == duration_matrix.tolist()
+    assert instance.machines_matrix == machines_matrix.tolist()
+    assert instance.num_machines == 3
+    assert all(
+        type(machine_id) is int  # pylint: disable=unidiomatic-typecheck
+        for job in instance.jobs
+        for operation in job
+        for machine_id in operation.machines
+    )
+
+
+@pytest.mark.parametrize(
+    "machines_matrix",
+    [[[0, 1, 2], [2, 1]], [[0, 1, 2], [2, 1, 0, 1]], [[0, 1, 2]]],
+)
+def test_from_matrices_with_mismatched_shapes(machines_matrix):
+    duration_matrix = [[1, 2, 3], [4, 5, 6]]
+
+    with pytest.raises(ValueError):
+        JobShopInstance.from_matrices(
+            duration_matrix=duration_matrix, machines_matrix=machines_matrix
+        )
+
+
 def test_num_jobs(job_shop_instance: JobShopInstance):
     assert job_shop_instance.num_jobs == 2
 
@@ -0,0 +1,190 @@
+import sys
+
+import imageio
+import matplotlib.pyplot as plt
+import pytest
+
+from job_shop_lib import JobShopInstance
+from job_shop_lib.exceptions import ValidationError
+from job_shop_lib.dispatching.rules import DispatchingRuleSolver
+from job_shop_lib.visualization import (
+    create_gif,
+    optimize_gif,
+    plot_gantt_chart_wrapper,
+)
+from job_shop_lib.visualization import (
+    _gantt_chart_video_and_gif_creation as gantt_chart_video_and_gif_creation,
+)
+from job_shop_lib.visualization._gantt_chart_video_and_gif_creation import (
+    _create_gantt_chart_images,
+)
+
+
+def test_create_gif(example_job_shop_instance: JobShopInstance, tmp_path):
+    gif_path = tmp_path / "example.gif"
+    solver = DispatchingRuleSolver("most_work_remaining")
+
+    create_gif(str(gif_path), example_job_shop_instance, solver)
+
+    frames = imageio.mimread(gif_path)
+    assert len(frames) == example_job_shop_instance.num_operations
+    assert list(tmp_path.iterdir()) == [gif_path]
+
+
+def test_create_gif_keeping_frames(
+    example_job_shop_instance: JobShopInstance, tmp_path
+):
+    gif_path = tmp_path / "example.gif"
+    frames_dir = tmp_path / "frames"
+    solver = DispatchingRuleSolver("most_work_remaining")
+
+    create_gif(
+        str(gif_path),
+        example_job_shop_instance,
+        solver,
+        remove_frames=False,
+        frames_dir=str(frames_dir),
+    )
+
+    frames = imageio.mimread(gif_path)
+    assert len(frames) == example_job_shop_instance.num_operations
+    assert len(list(frames_dir.iterdir())) == len(frames)
+
+
+def test_create_gif_in_parallel(
+    example_job_shop_instance: JobShopInstance, tmp_path
+):
+    solver = DispatchingRuleSolver("most_work_remaining")
+    sequential_gif_path = tmp_path / "sequential.gif"
+    parallel_gif_path = tmp_path / "parallel.gif"
+
+    create_gif(str(sequential_gif_path), example_job_shop_instance, solver)
+    create_gif(
+        str(parallel_gif_path),
+        example_job_shop_instance,
+        solver,
+        max_workers=2,
+    )
+
+    sequential_frames = imageio.mimread(sequential_gif_path)
+    parallel_frames = imageio.mimread(parallel_gif_path)
+    assert len(parallel_frames) == len(sequential_frames)
+    for sequential_frame, parallel_frame in zip(
+        sequential_frames, parallel_frames
+    ):
+        assert (sequential_frame == parallel_frame).all()
+
+
+def test_create_gif_optimized_without_gifsicle(
+    example_job_shop_instance: JobShopInstance, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("shutil.which", lambda _: None)
+    gif_path = tmp_path / "example.gif"
+    solver = DispatchingRuleSolver("most_work_remaining")
+
+    create_gif(str(gif_path), example_job_shop_instance, solver, optimize=True)
+
+    frames = imageio.mimread(gif_path)
+    assert len(frames) == example_job_shop_instance.num_operations
+    assert not optimize_gif(str(gif_path))
+
+
+def test_create_gif_with_ffmpeg(
+    example_job_shop_instance: JobShopInstance, tmp_path, monkeypatch
+):
+    # Fake ffmpeg that writes the number of bytes received to the output.
+    # It is run with the Python interpreter so that it also works on Windows.
+    fake_ffmpeg = tmp_path / "fake_ffmpeg.py"
+    fake_ffmpeg.write_text(
+        "import pathlib, sys\n"
+        "data = sys.stdin.buffer.read()\n"
+        "pathlib.Path(sys.argv[-1]).write_text(str(len(data)))\n"
+    )
+    monkeypatch.setattr("shutil.which", lambda _: "ffmpeg")
+    monkeypatch.setattr(
+        gantt_chart_video_and_gif_creation,
+        "_get_ffmpeg_gif_command",
+        lambda *args: [sys.executable, str(fake_ffmpeg), args[-1]],
+    )
+    gif_path = tmp_path / "example.gif"
+    solver = DispatchingRuleSolver("most_work_remaining")
+
+    create_gif(
+        str(gif_path), example_job_shop_instance, solver, use_ffmpeg=True
+    )
+
+    frame = next(
+        _create_gantt_chart_images(
+            example_job_shop_instance, solver, plot_gantt_chart_wrapper()
+        )
+    )
+    num_bytes = int(gif_path.read_text())
+    assert num_bytes == example_job_shop_instance.num_operations * frame.size
+
+
+def test_create_gif_without_solver_or_history(
+    example_job_shop_instance: JobShopInstance, tmp_path
+):
+    gif_path = tmp_path / "example.gif"
+    with pytest.raises(ValidationError):
+        create_gif(str(gif_path), example_job_shop_instance)
+    assert not gif_path.exists()
+
+
+def test_plot_gantt_chart_wrapper_returns_new_figures(
+    example_job_shop_instance: JobShopInstance, tmp_path
+):
+    solver = DispatchingRuleSolver("most_work_remaining")
+    schedule = solver.solve(example_job_shop_instance)
+    plot_function = plot_gantt_chart_wrapper()
+
+    fig = plot_function(schedule, None, None, 3)
+    assert plot_function(schedule, None, None, 5) is not fig
+
+    # Creating a GIF with the same function does not modify the figure
+    create_gif(
+        str(tmp_path / "example.gif"),
+        example_job_shop_instance,
+        solver,
+        plot_function=plot_function,
+    )
+    assert plt.fignum_exists(fig.number)
+    assert fig.axes[0].lines[0].get_xdata()[0] == 3
+    plt.close("all")
+
+
+def test_plot_gantt_chart_wrapper_reuses_figure(
+    example_job_shop_instance: JobShopInstance,
+):
+    schedule = DispatchingRuleSolver("most_work_remaining").solve(
+        example_job_shop_instance
+    )
+    plot_function = plot_gantt_chart_wrapper().with_figure_reuse()
+
+    fig = plot_function(schedule, None, None, 3)
+    assert plot_function(schedule, None, None, 5) is fig
+    assert len(fig.axes[0].lines) == 1
+
+    plt.close(fig)
+    assert plot_function(schedule, None, None, 5) is not fig
+    plt.close("all")
+
+
+def test_plot_gantt_chart_wrapper_does_not_accumulate_artists(
+    example_job_shop_instance: JobShopInstance,
+):
+    schedule = DispatchingRuleSolver("most_work_remaining").solve(
+        example_job_shop_instance
+    )
+    plot_function = plot_gantt_chart_wrapper().with_figure_reuse()
+
+    for current_time in range(schedule.makespan()):
+        fig = plot_function(schedule, None, None, current_time)
+    ax = fig.axes[0]
+    assert len(ax.lines) == 1
+    assert len(ax.collections) == schedule.num_scheduled_operations
+    plt.close("all")
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", __file__])